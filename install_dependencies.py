@@ -14,6 +14,7 @@ import time
 import logging
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # Configure logging
@@ -80,23 +81,24 @@ class SystemValidator:
             logger.warning(" Not running in virtual environment (recommended)")
         return in_venv
 
-def check_cuda_available():
-    """Check if CUDA is available on the system"""
+@lru_cache(maxsize=1)
+def _probe_cuda():
+    """Import torch and probe CUDA once, returning (available, version)"""
     try:
         import torch
-        return torch.cuda.is_available()
     except ImportError:
-        return False
+        return False, None
+    if torch.cuda.is_available():
+        return True, torch.version.cuda
+    return False, None
+
+def check_cuda_available():
+    """Check if CUDA is available on the system"""
+    return _probe_cuda()[0]
 
 def get_cuda_version():
     """Get CUDA version if available"""
-    try:
-        import torch
-        if torch.cuda.is_available():
-            return torch.version.cuda
-        return None
-    except ImportError:
-        return None
+    return _probe_cuda()[1]
 
 def install_pytorch_with_cuda():
     """Install PyTorch with CUDA support"""
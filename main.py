@@ -18,24 +18,28 @@ import os
 import sys
 import random
 import logging
+from logging.handlers import MemoryHandler
 from typing import List, Optional
 from dotenv import load_dotenv
 
+# Load environment variables before importing modules that read them at import time
+load_dotenv('ask.env')
+
 # Import essential functions
 from offline_question_generator import generate_single_question_for_category
 from offline_answer_generator import generate_answer
 from volume_manager import get_current_volume_info
 from research_csv_manager import log_qa_pair, read_log_csv, mark_questions_as_used
 
-# Load environment variables
-load_dotenv('ask.env')
-
-# Setup logging
+# Setup logging (file writes are buffered and flushed on errors or at exit)
+LOG_DIR = os.getenv('LOG_DIR', 'logs')
+os.makedirs(LOG_DIR, exist_ok=True)
+file_handler = logging.FileHandler(os.path.join(LOG_DIR, 'execution.log'))
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(f"{os.getenv('LOG_DIR', 'logs')}/execution.log")
+        MemoryHandler(capacity=64, flushLevel=logging.ERROR, target=file_handler)
     ]
 )
 log = logging.getLogger()
@@ -49,15 +53,41 @@ console_handler.setFormatter(console_formatter)
 console_logger.addHandler(console_handler)
 console_logger.setLevel(logging.INFO)
 
+# Console section separator
+SEPARATOR = "=" * 60
+
+# Name of the invoking script, shown in the usage text
+SCRIPT_NAME = os.path.basename(sys.argv[0]) or 'main.py'
+
 # Environment variables
-SIMPLE_MODE_THEMES = os.getenv('SIMPLE_MODE_THEMES', 'research_methodology,technology_innovation,sustainability_science,engineering_systems,environmental_design,urban_planning,spatial_design,digital_technology').split(',')
+SIMPLE_MODE_THEMES = tuple(os.getenv('SIMPLE_MODE_THEMES', 'research_methodology,technology_innovation,sustainability_science,engineering_systems,environmental_design,urban_planning,spatial_design,digital_technology').split(','))
+
+def log_text_only_qa_pair(theme: str, question: str, answer: str) -> bool:
+    """Log a Q&A pair to CSV without image files"""
+    return log_qa_pair(
+        theme=theme,
+        question=question,
+        answer=answer,
+        question_image="",  # No image
+        answer_image="",    # No image
+        question_style="Text-Only",
+        answer_style="Text-Only"
+    )
+
+def show_completion_summary(question: str, answer: str, theme: str):
+    """Show the completion summary for a generated Q&A pair"""
+    console_logger.info(SEPARATOR)
+    console_logger.info(" Text-Only Mode completed successfully!")
+    console_logger.info(" Question: %s", question)
+    console_logger.info(" Answer: %.200s...", answer)
+    console_logger.info(" Theme: %s", theme)
 
 def run_simple_mode():
     """Run the text-only mode with connected Q&A generation"""
     try:
-        console_logger.info("=" * 60)
+        console_logger.info(SEPARATOR)
         console_logger.info(" ASK: Daily Research - Text-Only Q&A Generator")
-        console_logger.info("=" * 60)
+        console_logger.info(SEPARATOR)
         console_logger.info("")
         console_logger.info(" Features:")
         console_logger.info(" • Reads all previous questions from log.csv")
@@ -69,9 +99,9 @@ def run_simple_mode():
         
         # Get current volume info
         current_volume, question_count, answer_count = get_current_volume_info()
-        console_logger.info(f" Current Volume: {current_volume}")
-        console_logger.info(f" Questions in volume: {question_count}")
-        console_logger.info(f" Answers in volume: {answer_count}")
+        console_logger.info(" Current Volume: %s", current_volume)
+        console_logger.info(" Questions in volume: %s", question_count)
+        console_logger.info(" Answers in volume: %s", answer_count)
         console_logger.info("")
         
         # Step 1: Read all previous questions from log.csv
@@ -83,60 +113,46 @@ def run_simple_mode():
             console_logger.info(" Starting fresh with standard question generation...")
             # Generate simple question for first run
             selected_theme = random.choice(SIMPLE_MODE_THEMES)
-            console_logger.info(f" Selected theme: {selected_theme}")
+            console_logger.info(" Selected theme: %s", selected_theme)
             
             # Generate question
             question = generate_single_question_for_category(selected_theme)
             if not question:
                 console_logger.error(" Failed to generate question")
                 return
-            console_logger.info(f" Generated question: {question}")
+            console_logger.info(" Generated question: %s", question)
             
             # Generate answer
             answer = generate_answer(question, selected_theme)
             if not answer:
                 console_logger.error(" Failed to generate answer")
                 return
-            console_logger.info(f" Generated answer: {answer[:100]}...")
+            console_logger.info(" Generated answer: %.100s...", answer)
             
             # Log Q&A pair (no image files)
-            success = log_qa_pair(
-                theme=selected_theme,
-                question=question,
-                answer=answer,
-                question_image="",  # No image
-                answer_image="",    # No image
-                question_style="Text-Only",
-                answer_style="Text-Only"
-            )
-            
-            if success:
+            if log_text_only_qa_pair(selected_theme, question, answer):
                 console_logger.info(" Q&A pair logged successfully")
-                console_logger.info("=" * 60)
-                console_logger.info(" Text-Only Mode completed successfully!")
-                console_logger.info(f" Question: {question}")
-                console_logger.info(f" Answer: {answer[:200]}...")
-                console_logger.info(f" Theme: {selected_theme}")
-                console_logger.info("=" * 60)
+                show_completion_summary(question, answer, selected_theme)
+                console_logger.info(SEPARATOR)
             else:
                 console_logger.error(" Failed to log Q&A pair")
             
             return
         
         # Step 2: Generate connected question
-        console_logger.info(f" Found {len(previous_qa_pairs)} previous Q&A pairs")
+        console_logger.info(" Found %s previous Q&A pairs", len(previous_qa_pairs))
         console_logger.info(" Step 2: Generating connected question...")
         
         # Select theme
         selected_theme = random.choice(SIMPLE_MODE_THEMES)
-        console_logger.info(f" Selected theme: {selected_theme}")
+        console_logger.info(" Selected theme: %s", selected_theme)
         
         # Generate connected question
         connected_question = generate_single_question_for_category(selected_theme)
         if not connected_question:
             console_logger.error(" Failed to generate connected question")
             return
-        console_logger.info(f" Connected question generated: {connected_question}")
+        console_logger.info(" Connected question generated: %s", connected_question)
         
         # Step 3: Generate connected answer
         console_logger.info(" Step 3: Generating connected answer...")
@@ -144,7 +160,7 @@ def run_simple_mode():
         if not answer:
             console_logger.error(" Failed to generate answer")
             return
-        console_logger.info(f" Connected answer generated: {answer[:100]}...")
+        console_logger.info(" Connected answer generated: %.100s...", answer)
         
         # Step 4: Mark question as used
         console_logger.info(" Step 4: Marking question as used...")
@@ -152,52 +168,38 @@ def run_simple_mode():
             questions_dict = {selected_theme: connected_question}
             marked_count = mark_questions_as_used(questions_dict)
             if marked_count > 0:
-                console_logger.info(f" Question marked as used (prevents duplicates)")
+                console_logger.info(" Question marked as used (prevents duplicates)")
             else:
                 console_logger.warning(" No questions marked as used")
         except Exception as e:
-            console_logger.warning(f" Could not mark question as used: {e}")
+            console_logger.warning(" Could not mark question as used: %s", e)
         
         # Step 5: Log complete Q&A pair
         console_logger.info(" Step 5: Logging complete Q&A pair to CSV...")
-        success = log_qa_pair(
-            theme=selected_theme,
-            question=connected_question,
-            answer=answer,
-            question_image="",  # No image
-            answer_image="",    # No image
-            question_style="Text-Only",
-            answer_style="Text-Only"
-        )
-        
-        if not success:
+        if not log_text_only_qa_pair(selected_theme, connected_question, answer):
             console_logger.error(" Failed to log Q&A pair")
             return
         console_logger.info(" Complete Q&A pair logged to CSV")
         
         # Completion summary
-        console_logger.info("=" * 60)
-        console_logger.info(" Text-Only Mode completed successfully!")
-        console_logger.info(f" Question: {connected_question}")
-        console_logger.info(f" Answer: {answer[:200]}...")
-        console_logger.info(f" Theme: {selected_theme}")
-        console_logger.info(f" Total Q&A pairs in database: {len(previous_qa_pairs) + 1}")
+        show_completion_summary(connected_question, answer, selected_theme)
+        console_logger.info(" Total Q&A pairs in database: %s", len(previous_qa_pairs) + 1)
         console_logger.info(" Connected experience created!")
-        console_logger.info("=" * 60)
+        console_logger.info(SEPARATOR)
         
     except Exception as e:
-        console_logger.error(f" Text-only mode failed: {e}")
+        console_logger.error(" Text-only mode failed: %s", e)
         raise
 
 def show_help():
     """Show help information"""
     console_logger.info("")
     console_logger.info(" ASK: Daily Research - Text-Only Q&A Generator")
-    console_logger.info("=" * 60)
+    console_logger.info(SEPARATOR)
     console_logger.info("")
     console_logger.info(" Usage:")
-    console_logger.info("   python main.py                    # Run text-only Q&A generation")
-    console_logger.info("   python main.py --help            # Show this help")
+    console_logger.info("   python %-27s# Run text-only Q&A generation", SCRIPT_NAME)
+    console_logger.info("   python %-27s# Show this help", SCRIPT_NAME + ' --help')
     console_logger.info("")
     console_logger.info(" Features:")
     console_logger.info(" • Text-only Q&A generation")
@@ -216,7 +218,7 @@ def main():
     try:
         console_logger.info("")
         console_logger.info(" *ASK*: Daily Research - Text-Only Q&A Generator")
-        console_logger.info("=" * 60)
+        console_logger.info(SEPARATOR)
         
         # Check command line arguments
         if len(sys.argv) > 1:
@@ -226,7 +228,7 @@ def main():
                 show_help()
                 return
             else:
-                console_logger.error(f"Unknown mode: {mode}")
+                console_logger.error("Unknown mode: %s", mode)
                 show_help()
                 return
         else:
@@ -236,7 +238,7 @@ def main():
     except KeyboardInterrupt:
         console_logger.info("\n Operation cancelled by user")
     except Exception as e:
-        console_logger.error(f" Unexpected error: {e}")
+        console_logger.error(" Unexpected error: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -22,6 +22,12 @@ from typing import Optional
 # Setup logging
 log = logging.getLogger(__name__)
 
+# Matches template placeholders; the group captures the placeholder name
+PLACEHOLDER_PATTERN = re.compile(r'\{([^}]+)\}')
+
+# Splits answer text into sentences, keeping the terminal punctuation
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
 # Predefined answer templates for offline generation
 ANSWER_TEMPLATES = {
     'research_methodology': [
@@ -205,6 +211,22 @@ ANSWER_CONCEPTS = {
     'cricket_standard': ['teamwork', 'discipline', 'strategy', 'adaptability', 'consistency', 'pressure handling', 'decision making', 'leadership', 'communication', 'focus']
 }
 
+# Fallback template for themes without dedicated answer templates
+DEFAULT_ANSWER_TEMPLATE = "The concept of {concept} represents a fundamental shift in how we approach {challenge}. By integrating {approach}, practitioners can create solutions that are both {outcome1} and {outcome2}. This approach emphasizes the importance of {principle} in contemporary practice, particularly when addressing {context}. The implementation of {concept} requires careful consideration of {factor}, ensuring that the final solution meets both functional and aesthetic requirements while contributing to {goal}."
+
+# Extra sentence appended to answers that fall short of the minimum length
+ADDITIONAL_CONTENT_TEMPLATE = " This approach demonstrates how {concept} can effectively address {challenge} in {context}. The implementation of such solutions requires careful consideration of {factor} to ensure successful outcomes."
+
+# (name, token) pairs for the placeholders used by each template that have
+# concepts to fill them, extracted once at import so the "{name}" tokens are
+# not rebuilt on every answer
+TEMPLATE_PLACEHOLDERS = {
+    template: tuple((name, '{' + name + '}') for name in dict.fromkeys(PLACEHOLDER_PATTERN.findall(template))
+                    if name in ANSWER_CONCEPTS)
+    for templates in (*ANSWER_TEMPLATES.values(), [DEFAULT_ANSWER_TEMPLATE])
+    for template in templates
+}
+
 def generate_offline_answer(question: str, theme: str) -> Optional[str]:
     """
     Generate an answer offline using predefined templates
@@ -217,14 +239,15 @@ def generate_offline_answer(question: str, theme: str) -> Optional[str]:
         str: Generated answer or None if failed
     """
     try:
-        # Normalize theme name
-        theme = theme.lower().replace(' ', '_')
+        # Normalize theme name (known template keys are already normalized)
+        if theme not in ANSWER_TEMPLATES:
+            theme = theme.lower().replace(' ', '_')
         
         # Get templates for theme
         if theme not in ANSWER_TEMPLATES:
-            log.warning(f"No answer templates available for theme: {theme}, using default template")
+            log.warning("No answer templates available for theme: %s, using default template", theme)
             # Use a default template for unsupported themes
-            template = "The concept of {concept} represents a fundamental shift in how we approach {challenge}. By integrating {approach}, practitioners can create solutions that are both {outcome1} and {outcome2}. This approach emphasizes the importance of {principle} in contemporary practice, particularly when addressing {context}. The implementation of {concept} requires careful consideration of {factor}, ensuring that the final solution meets both functional and aesthetic requirements while contributing to {goal}."
+            template = DEFAULT_ANSWER_TEMPLATE
         else:
             templates = ANSWER_TEMPLATES[theme]
             # Select random template
@@ -232,42 +255,44 @@ def generate_offline_answer(question: str, theme: str) -> Optional[str]:
         
         # Fill template with random concepts
         answer = template
-        for placeholder, concepts in ANSWER_CONCEPTS.items():
-            if placeholder in answer:
-                concept = random.choice(concepts)
-                answer = answer.replace(f"{{{placeholder}}}", concept)
+        for placeholder, token in TEMPLATE_PLACEHOLDERS[template]:
+            concept = random.choice(ANSWER_CONCEPTS[placeholder])
+            answer = answer.replace(token, concept)
         
         # Clean up any remaining placeholders
-        answer = re.sub(r'\{[^}]+\}', 'sustainable design', answer)
+        answer = PLACEHOLDER_PATTERN.sub('sustainable design', answer)
         
         # Ensure answer is comprehensive (minimum 200 words, no maximum limit)
         words = answer.split()
         if len(words) < 200:
             # Add more content to reach minimum length
-            additional_content = f" This approach demonstrates how {random.choice(ANSWER_CONCEPTS['concept'])} can effectively address {random.choice(ANSWER_CONCEPTS['challenge'])} in {random.choice(ANSWER_CONCEPTS['context'])}. The implementation of such solutions requires careful consideration of {random.choice(ANSWER_CONCEPTS['factor'])} to ensure successful outcomes."
+            additional_content = ADDITIONAL_CONTENT_TEMPLATE.format(
+                concept=random.choice(ANSWER_CONCEPTS['concept']),
+                challenge=random.choice(ANSWER_CONCEPTS['challenge']),
+                context=random.choice(ANSWER_CONCEPTS['context']),
+                factor=random.choice(ANSWER_CONCEPTS['factor'])
+            )
             answer += additional_content
         
         # Ensure proper sentence case (first letter capitalized, rest lowercase)
         if answer:
             # Split into sentences and capitalize first letter of each
-            sentences = re.split(r'(?<=[.!?])\s+', answer)
+            sentences = SENTENCE_BOUNDARY_PATTERN.split(answer)
             capitalized_sentences = []
             for sentence in sentences:
-                if sentence.strip():
+                sentence = sentence.strip()
+                if sentence:
                     # Capitalize first letter and make rest lowercase
-                    sentence = sentence.strip()
-                    if sentence:
-                        sentence = sentence[0].upper() + sentence[1:].lower()
-                    capitalized_sentences.append(sentence)
+                    capitalized_sentences.append(sentence[0].upper() + sentence[1:].lower())
             
             # Join sentences back together
             answer = ' '.join(capitalized_sentences)
         
-        log.info(f"Generated offline answer for theme '{theme}': {answer[:50]}...")
+        log.info("Generated offline answer for theme '%s': %.50s...", theme, answer)
         return answer
         
     except Exception as e:
-        log.error(f"Error generating offline answer for theme '{theme}': {e}")
+        log.error("Error generating offline answer for theme '%s': %s", theme, e)
         return None
 
 def generate_answer(question: str, theme: str) -> Optional[str]:
@@ -22,6 +22,9 @@ from typing import Optional, Dict, List
 # Setup logging
 log = logging.getLogger(__name__)
 
+# Matches template placeholders; the group captures the placeholder name
+PLACEHOLDER_PATTERN = re.compile(r'\{([^}]+)\}')
+
 # Predefined question templates for offline generation
 QUESTION_TEMPLATES = {
     'research_methodology': [
@@ -297,6 +300,16 @@ CONCEPTS = {
     'modern_era': ['professional cricket', 'technology integration', 'global leagues', 'performance analytics', 'fan engagement', 'broadcasting innovation', 'safety standards', 'sustainability practices', 'diversity inclusion', 'commercial development']
 }
 
+# (name, token) pairs for the placeholders used by each template that have
+# concepts to fill them, extracted once at import so the "{name}" tokens are
+# not rebuilt on every question
+TEMPLATE_PLACEHOLDERS = {
+    template: tuple((name, '{' + name + '}') for name in dict.fromkeys(PLACEHOLDER_PATTERN.findall(template))
+                    if name in CONCEPTS)
+    for templates in QUESTION_TEMPLATES.values()
+    for template in templates
+}
+
 def generate_offline_question(theme: str) -> Optional[str]:
     """
     Generate a question offline using predefined templates
@@ -308,12 +321,13 @@ def generate_offline_question(theme: str) -> Optional[str]:
         str: Generated question or None if failed
     """
     try:
-        # Normalize theme name
-        theme = theme.lower().replace(' ', '_')
+        # Normalize theme name (known template keys are already normalized)
+        if theme not in QUESTION_TEMPLATES:
+            theme = theme.lower().replace(' ', '_')
         
         # Get templates for theme
         if theme not in QUESTION_TEMPLATES:
-            log.warning(f"No templates available for theme: {theme}")
+            log.warning("No templates available for theme: %s", theme)
             return None
         
         templates = QUESTION_TEMPLATES[theme]
@@ -323,19 +337,18 @@ def generate_offline_question(theme: str) -> Optional[str]:
         
         # Fill template with random concepts
         question = template
-        for placeholder, concepts in CONCEPTS.items():
-            if placeholder in question:
-                concept = random.choice(concepts)
-                question = question.replace(f"{{{placeholder}}}", concept)
+        for placeholder, token in TEMPLATE_PLACEHOLDERS[template]:
+            concept = random.choice(CONCEPTS[placeholder])
+            question = question.replace(token, concept)
         
         # Clean up any remaining placeholders
-        question = re.sub(r'\{[^}]+\}', 'sustainable design', question)
+        question = PLACEHOLDER_PATTERN.sub('sustainable design', question)
         
-        log.info(f"Generated offline question for theme '{theme}': {question}")
+        log.info("Generated offline question for theme '%s': %s", theme, question)
         return question
         
     except Exception as e:
-        log.error(f"Error generating offline question for theme '{theme}': {e}")
+        log.error("Error generating offline question for theme '%s': %s", theme, e)
         return None
 
 def generate_single_question_for_category(theme: str) -> Optional[str]:
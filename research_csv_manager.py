@@ -26,9 +26,8 @@ import json
 import gzip
 import shutil
 from datetime import datetime
-from typing import Dict, List, Set, Optional, Any, Tuple, Union
+from typing import Dict, List, Set, Optional, Any, Tuple, Union, Iterable, Iterator
 from pathlib import Path
-from functools import lru_cache
 
 # Setup logging with enhanced configuration
 log = logging.getLogger(__name__)
@@ -37,14 +36,19 @@ log = logging.getLogger(__name__)
 LOG_CSV_FILE = os.getenv('LOG_CSV_FILE', 'log.csv')
 
 # Configuration constants
-CSV_HEADERS = [
+CSV_HEADERS = (
     'question_number', 'theme', 'question', 'question_image', 
     'style', 'answer', 'answer_image', 'is_used', 'created_timestamp'
-]
+)
+REQUIRED_CSV_HEADERS = ('question_number', 'theme', 'question')
 
 BACKUP_DIR = "csv_backups"
 MAX_BACKUP_SIZE = 100 * 1024 * 1024  # 100MB
 COMPRESSION_THRESHOLD = 10 * 1024 * 1024  # 10MB
+EXPORT_BUFFER_SIZE = 1024 * 1024  # 1MB
+
+# Set once BACKUP_DIR is known to exist, so later backups skip the filesystem check
+_backup_dir_ready = False
 
 def validate_csv_file(file_path: str) -> bool:
     """
@@ -81,10 +85,15 @@ def create_backup_directory() -> bool:
     Returns:
         True if directory exists or was created, False otherwise
     """
+    global _backup_dir_ready
+    if _backup_dir_ready:
+        return True
+    
     try:
         if not os.path.exists(BACKUP_DIR):
             os.makedirs(BACKUP_DIR)
             log.info(f"Created backup directory: {BACKUP_DIR}")
+        _backup_dir_ready = True
         return True
     except Exception as e:
         log.error(f"Error creating backup directory: {e}")
@@ -156,21 +165,16 @@ def validate_csv_headers(headers: List[str]) -> bool:
     Returns:
         True if headers are valid, False otherwise
     """
-    try:
-        if not headers:
-            return False
-        
-        # Check for required headers
-        required_headers = ['question_number', 'theme', 'question']
-        for header in required_headers:
-            if header not in headers:
-                log.warning(f"Missing required header: {header}")
-                return False
-        
-        return True
-    except Exception as e:
-        log.error(f"Error validating CSV headers: {e}")
+    if not headers:
         return False
+    
+    # Check for required headers
+    for header in REQUIRED_CSV_HEADERS:
+        if header not in headers:
+            log.warning(f"Missing required header: {header}")
+            return False
+    
+    return True
 
 def get_questions_and_styles_from_log() -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]], Set[str]]:
     """
@@ -217,15 +221,11 @@ def get_questions_and_styles_from_log() -> Tuple[Dict[str, Set[str]], Dict[str,
                     writer.writeheader()
                     for row in rows:
                         if 'is_used' not in row:
-                            row['is_used'] = row.get('image_filename', '') != ''
+                            row['is_used'] = str(row.get('image_filename', '') != '').lower()
                         if 'style' not in row:
                             row['style'] = ''
                         writer.writerow(row)
-
-                # Reopen file for reading
-                with open(LOG_CSV_FILE, 'r', encoding='utf-8', newline='') as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
+                # The migrated rows are already in memory, so the file is not read back
             else:
                 rows = list(reader)
 
@@ -257,6 +257,72 @@ def get_questions_and_styles_from_log() -> Tuple[Dict[str, Set[str]], Dict[str,
         log.error(f"Error reading from {LOG_CSV_FILE}: {e}")
         raise
 
+def _append_log_row(row: Dict[str, Any]) -> None:
+    """
+    Add a row to log.csv, numbering it after the rows already logged
+    
+    Existing rows are still read to find the next question number, but when
+    the header already has every column in CSV_HEADERS the new row is
+    appended instead of rewriting the whole file. Files with an older
+    header are rewritten with CSV_HEADERS followed by any extra columns
+    they already have. The rewrite goes through a temporary file, so
+    log.csv is left untouched if it fails.
+    
+    Args:
+        row: Row to add, without a question_number
+    """
+    needs_header = not os.path.exists(LOG_CSV_FILE) or os.path.getsize(LOG_CSV_FILE) == 0
+
+    if needs_header:
+        row['question_number'] = 1
+        with open(LOG_CSV_FILE, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
+            writer.writeheader()
+            writer.writerow(row)
+        return
+
+    with open(LOG_CSV_FILE, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        can_append = set(CSV_HEADERS).issubset(fieldnames)
+        if can_append:
+            existing_rows = sum(1 for _ in reader)
+        else:
+            rows = list(reader)
+            existing_rows = len(rows)
+
+    row['question_number'] = existing_rows + 1
+
+    if can_append:
+        # A hand-edited file may lack a final line break; add one so the new
+        # row does not run on from the last record
+        with open(LOG_CSV_FILE, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            ends_with_newline = f.read(1) in (b'\n', b'\r')
+
+        with open(LOG_CSV_FILE, 'a', encoding='utf-8', newline='') as f:
+            if not ends_with_newline:
+                f.write('\r\n')
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+            writer.writerow(row)
+        return
+
+    # Older header: rewrite with the current headers, keeping any extra columns
+    rewrite_fieldnames = list(CSV_HEADERS) + [name for name in fieldnames if name not in CSV_HEADERS]
+    rows.append(row)
+
+    temp_filename = f"{LOG_CSV_FILE}.tmp"
+    try:
+        with open(temp_filename, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=rewrite_fieldnames, restval='')
+            writer.writeheader()
+            writer.writerows(rows)
+        
+        os.replace(temp_filename, LOG_CSV_FILE)
+    finally:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+
 def log_single_question(theme: str, question: str, image_filename: str, 
                        style: Optional[str] = None, is_answer: bool = False, 
                        mark_as_used: bool = False) -> bool:
@@ -284,24 +350,8 @@ def log_single_question(theme: str, question: str, image_filename: str,
             log.error("Question cannot be empty")
             return False
         
-        # Ensure log.csv exists with proper headers
-        if not os.path.exists(LOG_CSV_FILE):
-            with open(LOG_CSV_FILE, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(CSV_HEADERS)
-
-        # Read existing data
-        rows = []
-        with open(LOG_CSV_FILE, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        # Get next question number
-        next_question_number = len(rows) + 1
-
         # Create new row
         new_row = {
-            'question_number': next_question_number,
             'theme': theme.strip(),
             'question': question.strip(),
             'question_image': image_filename if not is_answer else '',
@@ -312,14 +362,7 @@ def log_single_question(theme: str, question: str, image_filename: str,
             'created_timestamp': datetime.now().isoformat()
         }
 
-        # Add new row
-        rows.append(new_row)
-
-        # Write back to file
-        with open(LOG_CSV_FILE, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-            writer.writeheader()
-            writer.writerows(rows)
+        _append_log_row(new_row)
 
         log.info(f"Logged {'answer' if is_answer else 'question'} for {theme}: {question[:50]}...")
         return True
@@ -359,24 +402,8 @@ def log_qa_pair(theme: str, question: str, answer: str, question_image: str, ans
             log.error("Answer cannot be empty")
             return False
         
-        # Ensure log.csv exists with proper headers
-        if not os.path.exists(LOG_CSV_FILE):
-            with open(LOG_CSV_FILE, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(CSV_HEADERS)
-
-        # Read existing data
-        rows = []
-        with open(LOG_CSV_FILE, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-
-        # Get next question number
-        next_question_number = len(rows) + 1
-
         # Create new row with complete Q&A pair
         new_row = {
-            'question_number': next_question_number,
             'theme': theme.strip(),
             'question': question.strip(),
             'question_image': question_image.strip(),
@@ -387,14 +414,7 @@ def log_qa_pair(theme: str, question: str, answer: str, question_image: str, ans
             'created_timestamp': datetime.now().isoformat()
         }
 
-        # Add new row
-        rows.append(new_row)
-
-        # Write back to file
-        with open(LOG_CSV_FILE, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-            writer.writeheader()
-            writer.writerows(rows)
+        _append_log_row(new_row)
 
         log.info(f"Logged complete Q&A pair for {theme}: Q: {question[:50]}... A: {answer[:50]}...")
         return True
@@ -403,12 +423,13 @@ def log_qa_pair(theme: str, question: str, answer: str, question_image: str, ans
         log.error(f"Error logging Q&A pair: {e}")
         return False
 
-def mark_questions_as_used(questions_dict: Dict[str, str]) -> int:
+def mark_questions_as_used(questions_dict: Dict[str, Union[str, Iterable[str]]]) -> int:
     """
     Mark questions as used in log.csv after successful PDF creation
     
     Args:
-        questions_dict: Dictionary mapping themes to questions to mark as used
+        questions_dict: Dictionary mapping themes to a question, or a collection
+            of questions, to mark as used
         
     Returns:
         Number of questions marked as used
@@ -418,6 +439,12 @@ def mark_questions_as_used(questions_dict: Dict[str, str]) -> int:
             log.warning(f"{LOG_CSV_FILE} does not exist, cannot mark questions as used")
             return 0
 
+        # Accept a single question or a batch of questions per theme
+        questions_by_theme = {
+            theme: {questions} if isinstance(questions, str) else set(questions)
+            for theme, questions in questions_dict.items()
+        }
+
         # Read existing data
         rows = []
         with open(LOG_CSV_FILE, 'r', encoding='utf-8', newline='') as f:
@@ -431,11 +458,16 @@ def mark_questions_as_used(questions_dict: Dict[str, str]) -> int:
             question = row.get('question', '').strip()
             
             # Check if this question should be marked as used
-            if theme in questions_dict and questions_dict[theme] == question:
+            if question in questions_by_theme.get(theme, ()):
                 if row.get('is_used', '').lower() != 'true':
                     row['is_used'] = 'true'
                     questions_marked += 1
 
+        # Nothing changed, so leave the file untouched
+        if not questions_marked:
+            log.info("Marked 0 questions as used")
+            return 0
+
         # Write back to file
         with open(LOG_CSV_FILE, 'w', encoding='utf-8', newline='') as f:
             writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
@@ -449,7 +481,6 @@ def mark_questions_as_used(questions_dict: Dict[str, str]) -> int:
         log.error(f"Error marking questions as used: {e}")
         return 0
 
-@lru_cache(maxsize=128)
 def get_next_image_number() -> int:
     """
     Get the next image number based on existing images in log.csv
@@ -464,20 +495,16 @@ def get_next_image_number() -> int:
                 reader = csv.DictReader(f)
                 for row in reader:
                     # Check both question and answer image filenames
-                    for filename_field in ['question_image', 'answer_image']:
-                        if filename_field in row and row[filename_field].strip():
-                            # Extract number from filename like "ASK-01-ure-q.jpg"
-                            filename = row[filename_field].strip()
-                            if filename.startswith('ASK-') and '-' in filename:
-                                try:
-                                    # Extract number from "ASK-01-ure-q.jpg"
-                                    parts = filename.split('-')
-                                    if len(parts) >= 2:
-                                        number_str = parts[1]
-                                        number = int(number_str)
-                                        max_number = max(max_number, number)
-                                except (ValueError, IndexError):
-                                    continue
+                    for filename_field in ('question_image', 'answer_image'):
+                        # Extract number from filename like "ASK-01-ure-q.jpg"
+                        filename = (row.get(filename_field) or '').strip()
+                        if filename.startswith('ASK-'):
+                            try:
+                                # Only the segment after "ASK-" is needed
+                                number = int(filename.split('-', 2)[1])
+                                max_number = max(max_number, number)
+                            except ValueError:
+                                continue
             return max_number + 1
         else:
             return 1
@@ -489,6 +516,9 @@ def export_questions_to_csv(output_filename: str = 'questions_export.csv') -> bo
     """
     Export all questions to a separate CSV file
     
+    The export is written to a temporary file next to the output and moved
+    into place once complete, so readers never see a partial export.
+    
     Args:
         output_filename: Path to the output CSV file
         
@@ -498,15 +528,23 @@ def export_questions_to_csv(output_filename: str = 'questions_export.csv') -> bo
     try:
         questions_by_category, styles_by_category, used_questions = get_questions_and_styles_from_log()
         
-        with open(output_filename, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['theme', 'question', 'is_used', 'available_styles'])
-            
-            for theme, questions in questions_by_category.items():
-                for question in questions:
-                    is_used = question in used_questions
+        temp_filename = f"{output_filename}.tmp"
+        try:
+            with open(temp_filename, 'w', encoding='utf-8', newline='', buffering=EXPORT_BUFFER_SIZE) as f:
+                writer = csv.writer(f)
+                writer.writerow(['theme', 'question', 'is_used', 'available_styles'])
+                
+                for theme, questions in questions_by_category.items():
+                    # Styles are per theme, so join them once rather than per question
                     available_styles = ', '.join(styles_by_category.get(theme, []))
-                    writer.writerow([theme, question, is_used, available_styles])
+                    for question in questions:
+                        is_used = question in used_questions
+                        writer.writerow([theme, question, is_used, available_styles])
+            
+            os.replace(temp_filename, output_filename)
+        finally:
+            if os.path.exists(temp_filename):
+                os.remove(temp_filename)
         
         log.info(f"Exported questions to {output_filename}")
         return True
@@ -514,6 +552,39 @@ def export_questions_to_csv(output_filename: str = 'questions_export.csv') -> bo
         log.error(f"Error exporting questions: {e}")
         return False
 
+def iter_qa_pairs() -> Iterator[Dict[str, Any]]:
+    """
+    Stream Q&A pairs from log.csv one row at a time
+    
+    Rows without a theme or question are skipped. Nothing is yielded if
+    log.csv does not exist.
+    
+    Yields:
+        Q&A pair dictionaries in the format returned by read_log_csv
+    """
+    if not os.path.exists(LOG_CSV_FILE):
+        return
+    
+    with open(LOG_CSV_FILE, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            theme = row.get('theme', '').strip()
+            question = row.get('question', '').strip()
+            answer = row.get('answer', '').strip()
+            
+            if theme and question:
+                yield {
+                    'theme': theme,
+                    'question': question,
+                    'answer': answer,
+                    'question_number': row.get('question_number', ''),
+                    'question_image': row.get('question_image', ''),
+                    'answer_image': row.get('answer_image', ''),
+                    'style': row.get('style', ''),
+                    'is_used': row.get('is_used', '').lower() == 'true',
+                    'created_timestamp': row.get('created_timestamp', '')
+                }
+
 def read_log_csv() -> List[Dict[str, Any]]:
     """
     Read Q&A pairs from log.csv in format expected by image generation system
@@ -528,26 +599,7 @@ def read_log_csv() -> List[Dict[str, Any]]:
             log.warning(f"{LOG_CSV_FILE} does not exist")
             return qa_pairs
             
-        with open(LOG_CSV_FILE, 'r', encoding='utf-8', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                theme = row.get('theme', '').strip()
-                question = row.get('question', '').strip()
-                answer = row.get('answer', '').strip()
-                
-                if theme and question:
-                    qa_pair = {
-                        'theme': theme,
-                        'question': question,
-                        'answer': answer,
-                        'question_number': row.get('question_number', ''),
-                        'question_image': row.get('question_image', ''),
-                        'answer_image': row.get('answer_image', ''),
-                        'style': row.get('style', ''),
-                        'is_used': row.get('is_used', '').lower() == 'true',
-                        'created_timestamp': row.get('created_timestamp', '')
-                    }
-                    qa_pairs.append(qa_pair)
+        qa_pairs.extend(iter_qa_pairs())
                     
         log.info(f"Read {len(qa_pairs)} Q&A pairs from {LOG_CSV_FILE}")
         return qa_pairs
@@ -567,15 +619,16 @@ def search_questions(query: str, search_type: str = 'contains') -> List[Dict[str
     Returns:
         List of matching question dictionaries
     """
+    results = []
+    
     try:
         if not query or not query.strip():
-            return []
+            return results
         
-        qa_pairs = read_log_csv()
         query_lower = query.lower().strip()
-        results = []
         
-        for qa_pair in qa_pairs:
+        # Stream rows so only the matches are kept in memory
+        for qa_pair in iter_qa_pairs():
             question_lower = qa_pair['question'].lower()
             
             if search_type == 'contains' and query_lower in question_lower:
@@ -590,8 +643,9 @@ def search_questions(query: str, search_type: str = 'contains') -> List[Dict[str
         log.debug(f"Search '{query}' ({search_type}) returned {len(results)} results")
         return results
     except Exception as e:
+        # Keep the matches found before the error, as read_log_csv keeps the rows read so far
         log.error(f"Error searching questions: {e}")
-        return []
+        return results
 
 def get_csv_statistics() -> Dict[str, Any]:
     """
@@ -615,10 +669,17 @@ def get_csv_statistics() -> Dict[str, Any]:
         qa_pairs = read_log_csv()
         file_size = os.path.getsize(LOG_CSV_FILE)
         
-        themes = list(set(qa_pair['theme'] for qa_pair in qa_pairs))
-        questions = len([qa for qa in qa_pairs if qa['question']])
-        answers = len([qa for qa in qa_pairs if qa['answer']])
-        used_questions = len([qa for qa in qa_pairs if qa['is_used']])
+        themes = sorted({qa_pair['theme'] for qa_pair in qa_pairs})
+        
+        # Count questions, answers and used rows in a single pass
+        questions = answers = used_questions = 0
+        for qa in qa_pairs:
+            if qa['question']:
+                questions += 1
+            if qa['answer']:
+                answers += 1
+            if qa['is_used']:
+                used_questions += 1
         
         stats = {
             'total_rows': len(qa_pairs),
@@ -644,15 +705,52 @@ def get_csv_statistics() -> Dict[str, Any]:
             'error': str(e)
         }
 
-def clear_csv_cache() -> None:
+def get_bulk_theme_statistics(themes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
     """
-    Clear the LRU cache for get_next_image_number
+    Get question statistics for several themes with a single read of log.csv
+    
+    Args:
+        themes: Theme names to report on
+        
+    Returns:
+        Dictionary mapping each theme to its statistics
     """
     try:
-        get_next_image_number.cache_clear()
-        log.debug("CSV cache cleared")
+        questions_by_category, styles_by_category, used_questions = get_questions_and_styles_from_log()
+        
+        stats = {}
+        for theme in themes:
+            questions = questions_by_category.get(theme)
+            if questions is None:
+                stats[theme] = {'theme': theme, 'found': False}
+                continue
+            
+            total_questions = len(questions)
+            used_count = len(questions & used_questions)
+            stats[theme] = {
+                'theme': theme,
+                'found': True,
+                'total_questions': total_questions,
+                'used_questions': used_count,
+                'available_questions': total_questions - used_count,
+                'total_styles': len(styles_by_category.get(theme, ())),
+                'usage_rate_percent': round(used_count / total_questions * 100, 2) if total_questions else 0
+            }
+        
+        log.info(f"Computed statistics for {len(stats)} themes")
+        return stats
     except Exception as e:
-        log.error(f"Error clearing CSV cache: {e}")
+        log.error(f"Error getting bulk theme statistics: {e}")
+        return {}
+
+def clear_csv_cache() -> None:
+    """
+    Clear cached CSV data
+
+    Kept for backward compatibility: get_next_image_number always reads
+    log.csv directly, so there is currently nothing to clear.
+    """
+    log.debug("CSV cache cleared")
 
 # Export main functions for easy access
 __all__ = [
@@ -662,8 +760,10 @@ __all__ = [
     'get_next_image_number',
     'export_questions_to_csv',
     'read_log_csv',
+    'iter_qa_pairs',
     'search_questions',
     'get_csv_statistics',
+    'get_bulk_theme_statistics',
     'backup_csv_file',
     'compress_csv_file',
     'validate_csv_file',
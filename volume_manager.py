@@ -26,7 +26,7 @@ def _read_csv_data():
     """
     try:
         if not os.path.exists(LOG_CSV_FILE):
-            log.info(f"{LOG_CSV_FILE} does not exist")
+            log.info("%s does not exist", LOG_CSV_FILE)
             return []
         
         with open(LOG_CSV_FILE, 'r', encoding='utf-8', newline='') as f:
@@ -36,6 +36,42 @@ def _read_csv_data():
         log.error(f"Error reading CSV file: {e}")
         return []
 
+def _volume_info_from_rows(rows) -> Tuple[int, int, int]:
+    """
+    Calculate volume information from already-read CSV rows
+    
+    Args:
+        rows: List of CSV rows as returned by _read_csv_data()
+        
+    Returns:
+        Tuple[int, int, int]: (current_volume, qa_pairs_in_current_volume, total_qa_pairs)
+    """
+    # Count total Q&A pairs (rows with both question and answer)
+    total_qa_pairs = 0
+    for row in rows:
+        # Check if this row has both question and answer (complete Q&A pair)
+        question = row.get('question', '').strip()
+        answer = row.get('answer', '').strip()
+        if question and answer:
+            total_qa_pairs += 1
+            log.debug("Found complete Q&A pair: '%.50s...' -> '%.50s...'", question, answer)
+    
+    log.debug("Total complete Q&A pairs found: %d", total_qa_pairs)
+    
+    # Calculate current volume and pairs in current volume
+    if total_qa_pairs == 0:
+        current_volume = DEFAULT_VOLUME_NUMBER
+        qa_pairs_in_current_volume = 0
+    else:
+        current_volume = ((total_qa_pairs - 1) // QA_PAIRS_PER_VOLUME) + 1
+        qa_pairs_in_current_volume = total_qa_pairs % QA_PAIRS_PER_VOLUME
+        if qa_pairs_in_current_volume == 0:
+            qa_pairs_in_current_volume = QA_PAIRS_PER_VOLUME
+    
+    log.info("Volume info: Volume %d, %d/%d pairs in current volume, %d total pairs",
+             current_volume, qa_pairs_in_current_volume, QA_PAIRS_PER_VOLUME, total_qa_pairs)
+    return current_volume, qa_pairs_in_current_volume, total_qa_pairs
+
 def get_current_volume_info() -> Tuple[int, int, int]:
     """
     Get current volume information based on log.csv
@@ -45,35 +81,11 @@ def get_current_volume_info() -> Tuple[int, int, int]:
     """
     try:
         if not os.path.exists(LOG_CSV_FILE):
-            log.info(f"{LOG_CSV_FILE} does not exist, starting with volume {DEFAULT_VOLUME_NUMBER}")
+            log.info("%s does not exist, starting with volume %d", LOG_CSV_FILE, DEFAULT_VOLUME_NUMBER)
             return DEFAULT_VOLUME_NUMBER, 0, 0
         
-        # Count total Q&A pairs (rows with both question and answer)
-        total_qa_pairs = 0
-        rows = _read_csv_data()
-        for row in rows:
-            # Check if this row has both question and answer (complete Q&A pair)
-            question = row.get('question', '').strip()
-            answer = row.get('answer', '').strip()
-            if question and answer:
-                total_qa_pairs += 1
-                log.debug(f"Found complete Q&A pair: '{question[:50]}...' -> '{answer[:50]}...'")
-        
-        log.debug(f"Total complete Q&A pairs found: {total_qa_pairs}")
-        log.info(f"Reading from {LOG_CSV_FILE}")
-        
-        # Calculate current volume and pairs in current volume
-        if total_qa_pairs == 0:
-            current_volume = DEFAULT_VOLUME_NUMBER
-            qa_pairs_in_current_volume = 0
-        else:
-            current_volume = ((total_qa_pairs - 1) // QA_PAIRS_PER_VOLUME) + 1
-            qa_pairs_in_current_volume = total_qa_pairs % QA_PAIRS_PER_VOLUME
-            if qa_pairs_in_current_volume == 0:
-                qa_pairs_in_current_volume = QA_PAIRS_PER_VOLUME
-        
-        log.info(f"Volume info: Volume {current_volume}, {qa_pairs_in_current_volume}/{QA_PAIRS_PER_VOLUME} pairs in current volume, {total_qa_pairs} total pairs")
-        return current_volume, qa_pairs_in_current_volume, total_qa_pairs
+        log.info("Reading from %s", LOG_CSV_FILE)
+        return _volume_info_from_rows(_read_csv_data())
         
     except Exception as e:
         log.error(f"Error getting current volume info: {e}")
@@ -93,9 +105,11 @@ def should_increment_volume() -> bool:
         should_increment = qa_pairs_in_current_volume == QA_PAIRS_PER_VOLUME
         
         if should_increment:
-            log.info(f"Volume {current_volume} is complete ({QA_PAIRS_PER_VOLUME} pairs), will increment to volume {current_volume + 1}")
+            log.info("Volume %d is complete (%d pairs), will increment to volume %d",
+                     current_volume, QA_PAIRS_PER_VOLUME, current_volume + 1)
         else:
-            log.info(f"Volume {current_volume} has {qa_pairs_in_current_volume}/{QA_PAIRS_PER_VOLUME} pairs, no increment needed")
+            log.info("Volume %d has %d/%d pairs, no increment needed",
+                     current_volume, qa_pairs_in_current_volume, QA_PAIRS_PER_VOLUME)
         
         return should_increment
         
@@ -119,7 +133,7 @@ def get_next_volume_number() -> int:
         else:
             next_volume = current_volume
         
-        log.info(f"Next volume number: {next_volume}")
+        log.info("Next volume number: %d", next_volume)
         return next_volume
         
     except Exception as e:
@@ -135,7 +149,7 @@ def get_next_image_number() -> int:
     """
     try:
         if not os.path.exists(LOG_CSV_FILE):
-            log.info(f"{LOG_CSV_FILE} does not exist, starting with image number 1")
+            log.info("%s does not exist, starting with image number 1", LOG_CSV_FILE)
             return 1
         
         # Count total images (rows with question_image or answer_image)
@@ -147,13 +161,13 @@ def get_next_image_number() -> int:
             answer_image = row.get('answer_image', '').strip()
             if question_image:
                 total_images += 1
-                log.debug(f"Found question image: {question_image}")
+                log.debug("Found question image: %s", question_image)
             if answer_image:
                 total_images += 1
-                log.debug(f"Found answer image: {answer_image}")
+                log.debug("Found answer image: %s", answer_image)
         
         next_image_number = total_images + 1
-        log.info(f"Next image number: {next_image_number} (total images so far: {total_images})")
+        log.info("Next image number: %d (total images so far: %d)", next_image_number, total_images)
         return next_image_number
         
     except Exception as e:
@@ -169,7 +183,7 @@ def get_next_question_image_number() -> int:
     """
     try:
         if not os.path.exists(LOG_CSV_FILE):
-            log.info(f"{LOG_CSV_FILE} does not exist, starting with question image number 1")
+            log.info("%s does not exist, starting with question image number 1", LOG_CSV_FILE)
             return 1
         
         # Count total question images
@@ -179,11 +193,12 @@ def get_next_question_image_number() -> int:
             question_image = row.get('question_image', '').strip()
             if question_image:
                 total_question_images += 1
-                log.debug(f"Found question image: {question_image}")
+                log.debug("Found question image: %s", question_image)
         
         # Question images are odd numbers: 1, 3, 5, 7...
         next_question_image_number = (total_question_images * 2) + 1
-        log.info(f"Next question image number: {next_question_image_number} (total question images so far: {total_question_images})")
+        log.info("Next question image number: %d (total question images so far: %d)",
+                 next_question_image_number, total_question_images)
         return next_question_image_number
         
     except Exception as e:
@@ -199,7 +214,7 @@ def get_next_answer_image_number() -> int:
     """
     try:
         if not os.path.exists(LOG_CSV_FILE):
-            log.info(f"{LOG_CSV_FILE} does not exist, starting with answer image number 2")
+            log.info("%s does not exist, starting with answer image number 2", LOG_CSV_FILE)
             return 2
         
         # Count total answer images
@@ -209,11 +224,12 @@ def get_next_answer_image_number() -> int:
             answer_image = row.get('answer_image', '').strip()
             if answer_image:
                 total_answer_images += 1
-                log.debug(f"Found answer image: {answer_image}")
+                log.debug("Found answer image: %s", answer_image)
         
         # Answer images are even numbers: 2, 4, 6, 8...
         next_answer_image_number = (total_answer_images * 2) + 2
-        log.info(f"Next answer image number: {next_answer_image_number} (total answer images so far: {total_answer_images})")
+        log.info("Next answer image number: %d (total answer images so far: %d)",
+                 next_answer_image_number, total_answer_images)
         return next_answer_image_number
         
     except Exception as e:
@@ -237,7 +253,8 @@ def get_volume_progress() -> dict:
             'qa_pairs_per_volume': QA_PAIRS_PER_VOLUME,
             'volume_progress_percentage': (qa_pairs_in_current_volume / QA_PAIRS_PER_VOLUME) * 100,
             'pairs_until_next_volume': QA_PAIRS_PER_VOLUME - qa_pairs_in_current_volume,
-            'should_increment_volume': should_increment_volume()
+            # Same rule as should_increment_volume(), without re-reading log.csv
+            'should_increment_volume': qa_pairs_in_current_volume == QA_PAIRS_PER_VOLUME
         }
         
         return progress
@@ -280,7 +297,8 @@ def get_image_progress() -> dict:
             if answer_image:
                 total_images += 1
         
-        current_volume, qa_pairs_in_current_volume, total_qa_pairs = get_current_volume_info()
+        # Reuse the rows already read instead of loading log.csv again
+        current_volume, qa_pairs_in_current_volume, total_qa_pairs = _volume_info_from_rows(rows)
         
         # Calculate images in current volume
         images_in_current_volume = total_images % QA_PAIRS_PER_VOLUME
@@ -315,12 +333,12 @@ def log_volume_info():
         log.info("=" * 50)
         log.info("VOLUME PROGRESS INFORMATION")
         log.info("=" * 50)
-        log.info(f"Current Volume: {progress['current_volume']}")
-        log.info(f"Q&A Pairs in Current Volume: {progress['qa_pairs_in_current_volume']}/{progress['qa_pairs_per_volume']}")
-        log.info(f"Total Q&A Pairs: {progress['total_qa_pairs']}")
-        log.info(f"Volume Progress: {progress['volume_progress_percentage']:.1f}%")
-        log.info(f"Pairs Until Next Volume: {progress['pairs_until_next_volume']}")
-        log.info(f"Should Increment Volume: {progress['should_increment_volume']}")
+        log.info("Current Volume: %d", progress['current_volume'])
+        log.info("Q&A Pairs in Current Volume: %d/%d", progress['qa_pairs_in_current_volume'], progress['qa_pairs_per_volume'])
+        log.info("Total Q&A Pairs: %d", progress['total_qa_pairs'])
+        log.info("Volume Progress: %.1f%%", progress['volume_progress_percentage'])
+        log.info("Pairs Until Next Volume: %d", progress['pairs_until_next_volume'])
+        log.info("Should Increment Volume: %s", progress['should_increment_volume'])
         log.info("=" * 50)
         
     except Exception as e: